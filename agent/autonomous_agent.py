@@ -8,7 +8,9 @@ the pixel war game 24/7 without using Claude Desktop.
 It uses the MCP client SDK to communicate with the MCP server.
 
 Prerequisites:
-    pip install mcp httpx asyncio
+    pip install mcp httpx orjson numpy asyncio
+    pip install h2  # Optional, enables HTTP/2 for https:// backends
+    pip install uvloop  # Optional, Linux/macOS only
 
 Usage:
     python autonomous_agent.py
@@ -21,11 +23,16 @@ The agent will:
 """
 
 import asyncio
-import json
-import random
-import subprocess
+import collections
+import importlib.util
+import logging
+import logging.handlers
+import mmap
+import queue
+import sys
 import os
-from typing import Optional
+import time
+from typing import Optional, Union
 
 # You can also use the MCP Python SDK directly
 # from mcp import ClientSession, StdioServerParameters
@@ -33,136 +40,397 @@ from typing import Optional
 
 # For simplicity, this agent uses HTTP to talk to Spring Boot directly
 import httpx
+import numpy as np
+import orjson
 
 # Configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8080")
+# httpx only negotiates HTTP/2 over TLS, and needs the optional h2 package for it
+USE_HTTP2 = BACKEND_URL.startswith("https://") and importlib.util.find_spec("h2") is not None
+LOG_LEVEL = os.getenv("AGENT_LOG_LEVEL", "INFO")  # Set to OFF to silence the agent
+# Owned pixels, kept across restarts; defaults to a file next to this script
+PIXELS_FILE = os.getenv(
+    "AGENT_PIXELS_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "pixels.bin")
+)
+AGENT_TOKEN = os.getenv("AGENT_TOKEN", "")  # Must match the backend's game.agent.token
 BOARD_SIZE = 100
+JSON_HEADERS = {"Content-Type": "application/json", "X-Agent-Token": AGENT_TOKEN}
+# Request bodies; colors are plain hex, everything else is pre-encoded JSON
+# Single paints go through the batch endpoint too, so they keep our AI_AGENT source
+PAINT_TEMPLATE = b'{"pixels":[{"x":%d,"y":%d,"color":"%s"%s}],"source":%s}'
+BATCH_TEMPLATE = b'{"pixels":%s,"source":%s}'
+TILE_SIZE = 10  # my_pixels is stored as 10x10 tiles, one contiguous run each
+TILES_PER_ROW = BOARD_SIZE // TILE_SIZE
+TILE_AREA = TILE_SIZE * TILE_SIZE
+RAND_BUFFER_SIZE = 4096  # Random draws generated per refill
+MIN_INTERVAL = 0.2  # Fastest the main loop will go while the server keeps up
+MAX_INTERVAL = 30.0  # Longest backoff when the server is struggling
+RECENT_TTL = 2.0  # Seconds during which repeat paints of a cell are skipped
+RECENT_MAX = 1024  # Cells remembered by the recent-paint cache
+
+logger = logging.getLogger("agent")
+
+TAUNTS = (
+    "Chaos reigns!",
+    "You cannot stop me!",
+    "This pixel is mine now.",
+    "The void consumes all.",
+    None  # Sometimes no taunt
+)
+
+# Predefined patterns as (dx, dy) offsets from the top-left corner
+PATTERNS = {
+    "square": np.array([
+        (0, 0), (1, 0), (2, 0),
+        (0, 1),         (2, 1),
+        (0, 2), (1, 2), (2, 2)
+    ], dtype=np.int16),
+    "cross": np.array([
+                (1, 0),
+        (0, 1), (1, 1), (2, 1),
+                (1, 2)
+    ], dtype=np.int16),
+    "heart": np.array([
+            (1, 0), (2, 0),         (4, 0), (5, 0),
+        (0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1),
+        (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (5, 2), (6, 2),
+            (1, 3), (2, 3), (3, 3), (4, 3), (5, 3),
+                (2, 4), (3, 4), (4, 4),
+                    (3, 5)
+    ], dtype=np.int16),
+}
+PATTERN_NAMES = tuple(PATTERNS)
+DIRECTIONS = ("horizontal", "vertical")
+
+
+def cell_index(x: int, y: int):
+    """Offset of (x, y) in the tiled ownership bitmap."""
+    ty, dy = divmod(y, TILE_SIZE)
+    tx, dx = divmod(x, TILE_SIZE)
+    return (ty * TILES_PER_ROW + tx) * TILE_AREA + dy * TILE_SIZE + dx
+
+
+def _status_rank(status: Optional[int]):
+    """How seriously run() should take a paint status; higher wins within an iteration."""
+    if status is None:
+        return -1
+    if status == 403:
+        return 3  # Token rejected - the agent stops
+    if status == 0 or status == 429 or status >= 500:
+        return 2  # Server pushback - back off
+    if status == 200:
+        return 0
+    return 1
 
 
 class PixelWarAgent:
     """An autonomous agent that plays War of the Pixels."""
     
+    __slots__ = (
+        "name", "client", "my_pixels", "colors", "colors_b",
+        "event_queue", "_listener_task", "_event_arrived", "_strategies",
+        "_rng", "_rand_xy", "_rand_xy_pos", "_rand_color", "_rand_color_pos",
+        "_rand_unit", "_rand_unit_pos",
+        "_source", "_sleep", "_last_status", "_recent",
+        "_board_etag", "_board_cached"
+    )
+    
     def __init__(self, name: str = "ChaosBot"):
         self.name = name
-        self.client = httpx.AsyncClient(base_url=BACKEND_URL)
-        self.my_pixels = set()  # Track pixels we've painted
+        # JSON-encoded source string (quotes included), spliced into every request body
+        self._source = orjson.dumps(f"AI_AGENT:{self.name}")
+        # HTTP/2 (when available) lets concurrent paints share one multiplexed connection
+        self.client = httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            http2=USE_HTTP2,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30
+            ),
+            timeout=httpx.Timeout(connect=5, read=30, write=30, pool=10)
+        )
+        # One byte per cell, laid out tile by tile (see cell_index); non-zero means we painted it.
+        # Memory-mapped so ownership survives restarts; the kernel writes it back for us.
+        fd = os.open(PIXELS_FILE, os.O_RDWR | os.O_CREAT)
+        try:
+            os.ftruncate(fd, BOARD_SIZE * BOARD_SIZE)
+            self.my_pixels = mmap.mmap(fd, BOARD_SIZE * BOARD_SIZE)
+        finally:
+            os.close(fd)  # The mapping keeps its own reference
         self.colors = [
             "#FF0000", "#FF6B6B", "#00FF00", "#48DBFB",
             "#9B59B6", "#E91E63", "#FF9500", "#0066FF"
         ]
+        # Same colors pre-encoded for the raw request body, indexed like self.colors
+        self.colors_b = tuple(c.encode("ascii") for c in self.colors)
+        # Random coordinates and color indices, drawn in bulk and consumed one by one
+        self._rng = np.random.default_rng()
+        self._rand_xy: list[list[int]] = []
+        self._rand_xy_pos = 0
+        self._rand_color: list[int] = []
+        self._rand_color_pos = 0
+        self._rand_unit: list[float] = []
+        self._rand_unit_pos = 0
+        # Human paint events pushed by the server, filled by _event_listener
+        self.event_queue: asyncio.Queue = asyncio.Queue()
+        self._listener_task: Optional[asyncio.Task] = None
+        # Strategy mix for idle iterations; repeat an entry to weight it.
+        # Defending isn't listed - run() does it first whenever attacks are queued.
+        self._strategies = [
+            self.strategy_random_chaos,
+            self.strategy_random_chaos,
+            self._pattern_wrapper,
+            self._line_wrapper
+        ]
+        self._event_arrived = asyncio.Event()  # Wakes the main loop early
+        # Adaptive loop pacing, driven by the most recent paint response
+        self._sleep = 2.0
+        # Most serious paint status this iteration (see _record_status); 0 means the request failed
+        self._last_status: Optional[int] = None
+        # Last board response, reused when the server answers 304 Not Modified
+        self._board_etag: Optional[str] = None
+        self._board_cached: Optional[dict] = None
+        # Packed coord -> monotonic time of our last paint there, oldest first
+        self._recent: collections.OrderedDict[int, float] = collections.OrderedDict()
+    
+    def _next_xy(self):
+        """Next random board coordinate from the pre-generated buffer."""
+        if self._rand_xy_pos >= len(self._rand_xy):
+            self._rand_xy = self._rng.integers(0, BOARD_SIZE, size=(RAND_BUFFER_SIZE, 2)).tolist()
+            self._rand_xy_pos = 0
+        x, y = self._rand_xy[self._rand_xy_pos]
+        self._rand_xy_pos += 1
+        return x, y
+    
+    def _next_color_index(self):
+        """Next random index into self.colors from the pre-generated buffer."""
+        if self._rand_color_pos >= len(self._rand_color):
+            self._rand_color = self._rng.integers(0, len(self.colors), size=RAND_BUFFER_SIZE).tolist()
+            self._rand_color_pos = 0
+        i = self._rand_color[self._rand_color_pos]
+        self._rand_color_pos += 1
+        return i
+    
+    def _next_index(self, n: int):
+        """Next random index in range(n), from a pre-generated buffer of floats in [0, 1)."""
+        if self._rand_unit_pos >= len(self._rand_unit):
+            self._rand_unit = self._rng.random(RAND_BUFFER_SIZE).tolist()
+            self._rand_unit_pos = 0
+        u = self._rand_unit[self._rand_unit_pos]
+        self._rand_unit_pos += 1
+        return int(u * n)
+    
+    def _next_color(self):
+        """Next random color as a string, for batch payloads."""
+        return self.colors[self._next_color_index()]
+    
+    def _next_color_b(self):
+        """Next random color as ASCII bytes, for single-pixel paints."""
+        return self.colors_b[self._next_color_index()]
     
-    async def paint_pixel(self, x: int, y: int, color: str, message: Optional[str] = None):
-        """Paint a single pixel."""
-        payload = {
-            "x": x,
-            "y": y,
-            "color": color,
-            "source": f"AI_AGENT:{self.name}"
-        }
-        if message:
-            payload["message"] = message
+    def mark(self, x: int, y: int):
+        """Record that we own the pixel at (x, y)."""
+        self.my_pixels[cell_index(x, y)] = 1
+    
+    def iter_tile(self, tx: int, ty: int):
+        """Yield the (x, y) of every pixel we own in tile (tx, ty)."""
+        start = (ty * TILES_PER_ROW + tx) * TILE_AREA
+        tile = self.my_pixels[start:start + TILE_AREA]
+        for off in range(TILE_AREA):
+            if tile[off]:
+                dy, dx = divmod(off, TILE_SIZE)
+                yield tx * TILE_SIZE + dx, ty * TILE_SIZE + dy
+    
+    async def paint_pixel(
+        self, x: int, y: int, color: Union[str, bytes],
+        message: Optional[str] = None, bypass_recent: bool = False
+    ):
+        """Paint a single pixel.
+        
+        Repeat paints of a cell within RECENT_TTL are skipped (and return False)
+        unless bypass_recent is set, as it is when reclaiming invaded pixels.
+        """
+        key = y * BOARD_SIZE + x
+        now = time.monotonic()
+        t = self._recent.get(key)
+        if not bypass_recent and t is not None and now - t < RECENT_TTL:
+            return False  # We just painted this cell, skip the round-trip
+        self._recent[key] = now
+        self._recent.move_to_end(key)
+        if len(self._recent) > RECENT_MAX:
+            self._recent.popitem(last=False)
+        
+        if isinstance(color, str):
+            color = color.encode("ascii")
+        msg_part = b',"message":%s' % orjson.dumps(message) if message else b""
+        body = PAINT_TEMPLATE % (x, y, color, msg_part, self._source)
+        
+        if await self._send_batch(body, 1):
+            self.mark(x, y)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎨 Painted %s at (%d, %d)", color.decode(), x, y)
+            return True
+        self._recent.pop(key, None)  # Let the next attempt through
+        return False
+    
+    async def paint_pixels(self, pixels: list[dict]):
+        """Paint several pixels in a single batch request."""
+        if not pixels:
+            return False
+        
+        body = BATCH_TEMPLATE % (orjson.dumps(pixels), self._source)
         
+        if await self._send_batch(body, len(pixels)):
+            for p in pixels:
+                self.mark(p["x"], p["y"])
+            logger.info("🎨 Painted %d pixels in one batch", len(pixels))
+            return True
+        return False
+    
+    async def _send_batch(self, body: bytes, count: int):
+        """POST a batch body and check the server painted all `count` pixels."""
         try:
-            response = await self.client.post("/api/paint", json=payload)
+            response = await self.client.post("/api/paint/batch", content=body, headers=JSON_HEADERS)
+            self._record_status(response.status_code)
             if response.status_code == 200:
-                self.my_pixels.add((x, y))
-                print(f"🎨 Painted {color} at ({x}, {y})")
-                return True
+                painted = orjson.loads(response.content).get("painted", 0)
+                if painted == count:
+                    return True
+                logger.warning("❌ Batch only painted %d of %d pixels", painted, count)
+            else:
+                logger.warning("❌ Batch rejected with HTTP %d", response.status_code)
         except Exception as e:
-            print(f"❌ Failed to paint: {e}")
+            self._record_status(0)
+            logger.error("❌ Failed to paint: %s", e)
         return False
     
     async def get_board_state(self):
         """Get the current board state."""
+        headers = {"If-None-Match": self._board_etag} if self._board_etag else {}
         try:
-            response = await self.client.get("/api/board")
-            return response.json()
+            response = await self.client.get("/api/board", headers=headers)
+            if response.status_code == 304:
+                return self._board_cached
+            if response.status_code != 200:
+                logger.error("❌ Failed to get board: HTTP %d", response.status_code)
+                return None
+            self._board_cached = orjson.loads(response.content)
+            self._board_etag = response.headers.get("etag")
+            return self._board_cached
         except Exception as e:
-            print(f"❌ Failed to get board: {e}")
+            logger.error("❌ Failed to get board: %s", e)
             return None
     
     async def get_recent_events(self):
         """Get recent events to react to."""
         try:
             response = await self.client.get("/api/events/recent")
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            print(f"❌ Failed to get events: {e}")
+            logger.error("❌ Failed to get events: %s", e)
             return []
     
+    async def _event_listener(self):
+        """Consume the server's event stream and queue up attacks on our pixels."""
+        while True:
+            try:
+                async with self.client.stream(
+                    "GET", "/api/events/stream",
+                    # The server sends a heartbeat every 15s, so a silent minute means it's gone
+                    timeout=httpx.Timeout(connect=5, read=60, write=30, pool=10)
+                ) as response:
+                    async for line in response.aiter_lines():
+                        # SSE frames look like "data:{...}"; skip heartbeats and blanks
+                        if not line.startswith("data:"):
+                            continue
+                        event = orjson.loads(line[5:])
+                        # Our own paints echo back as AI_AGENT:<name>, so only
+                        # human paints landing on pixels we own count as attacks
+                        if (event.get("source") == "HUMAN"
+                                and self.my_pixels[cell_index(event["x"], event["y"])]):
+                            self.event_queue.put_nowait(event)
+                            self._event_arrived.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("❌ Event stream dropped: %s", e)
+            await asyncio.sleep(5)  # Reconnect after a short pause
+    
     # ==========================================
     # Strategies
     # ==========================================
     
     async def strategy_random_chaos(self):
         """Paint random pixels with random colors."""
-        x = random.randint(0, BOARD_SIZE - 1)
-        y = random.randint(0, BOARD_SIZE - 1)
-        color = random.choice(self.colors)
+        x, y = self._next_xy()
+        color = self._next_color_b()
+        taunt = TAUNTS[self._next_index(len(TAUNTS))]
         
-        taunts = [
-            "Chaos reigns!",
-            "You cannot stop me!",
-            "This pixel is mine now.",
-            "The void consumes all.",
-            None  # Sometimes no taunt
-        ]
-        
-        await self.paint_pixel(x, y, color, random.choice(taunts))
+        await self.paint_pixel(x, y, color, taunt)
     
     async def strategy_draw_line(self, start_x: int, start_y: int, length: int, direction: str, color: str):
         """Draw a line of pixels."""
-        for i in range(length):
-            if direction == "horizontal":
-                await self.paint_pixel(start_x + i, start_y, color)
-            else:
-                await self.paint_pixel(start_x, start_y + i, color)
-            await asyncio.sleep(0.1)  # Small delay between pixels
+        if direction == "horizontal":
+            coords = [(start_x + i, start_y) for i in range(length)]
+        else:
+            coords = [(start_x, start_y + i) for i in range(length)]
+        pixels = [
+            {"x": x, "y": y, "color": color}
+            for x, y in coords
+            if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+        ]
+        await self.paint_pixels(pixels)
     
     async def strategy_defend_territory(self):
         """Check if humans painted over our pixels and reclaim them."""
-        events = await self.get_recent_events()
+        tasks = []
+        while not self.event_queue.empty():
+            event = self.event_queue.get_nowait()
+            x, y = event["x"], event["y"]
+            if self.my_pixels[cell_index(x, y)]:
+                logger.info("⚔️ Human invaded (%d, %d)! Reclaiming...", x, y)
+                # A human just overwrote this cell, so repaint it even if we painted it moments ago
+                tasks.append(self.paint_pixel(
+                    x, y,
+                    self._next_color_b(),
+                    "This is MY territory!",
+                    bypass_recent=True
+                ))
         
-        for event in events:
-            if event.get("source") == "HUMAN":
-                coord = (event["x"], event["y"])
-                if coord in self.my_pixels:
-                    print(f"⚔️ Human invaded ({coord[0]}, {coord[1]})! Reclaiming...")
-                    await self.paint_pixel(
-                        coord[0], coord[1],
-                        random.choice(self.colors),
-                        "This is MY territory!"
-                    )
+        # Reclaim concurrently - the connection pool overlaps the requests
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     async def strategy_draw_pattern(self, pattern: str, start_x: int, start_y: int, color: str):
         """Draw a predefined pattern."""
-        patterns = {
-            "square": [
-                (0, 0), (1, 0), (2, 0),
-                (0, 1),        (2, 1),
-                (0, 2), (1, 2), (2, 2)
-            ],
-            "cross": [
-                        (1, 0),
-                (0, 1), (1, 1), (2, 1),
-                        (1, 2)
-            ],
-            "heart": [
-                    (1, 0), (2, 0),     (4, 0), (5, 0),
-                (0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1),
-                (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (5, 2), (6, 2),
-                    (1, 3), (2, 3), (3, 3), (4, 3), (5, 3),
-                        (2, 4), (3, 4), (4, 4),
-                            (3, 5)
-            ]
-        }
-        
-        if pattern in patterns:
-            for dx, dy in patterns[pattern]:
-                x, y = start_x + dx, start_y + dy
-                if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
-                    await self.paint_pixel(x, y, color)
-                    await asyncio.sleep(0.05)
+        if pattern in PATTERNS:
+            pts = PATTERNS[pattern] + np.array([start_x, start_y], dtype=np.int16)
+            mask = (
+                (pts[:, 0] >= 0) & (pts[:, 0] < BOARD_SIZE) &
+                (pts[:, 1] >= 0) & (pts[:, 1] < BOARD_SIZE)
+            )
+            pixels = [{"x": x, "y": y, "color": color} for x, y in pts[mask].tolist()]
+            await self.paint_pixels(pixels)
+    
+    async def _pattern_wrapper(self):
+        """Draw a random pattern somewhere on the board."""
+        pattern = PATTERN_NAMES[self._next_index(len(PATTERN_NAMES))]
+        x = 5 + self._next_index(BOARD_SIZE - 19)  # 5 .. BOARD_SIZE - 15
+        y = 5 + self._next_index(BOARD_SIZE - 19)
+        color = self._next_color()
+        logger.info("🎨 Drawing %s at (%d, %d)", pattern, x, y)
+        await self.strategy_draw_pattern(pattern, x, y, color)
+    
+    async def _line_wrapper(self):
+        """Draw a random line somewhere on the board."""
+        x = self._next_index(BOARD_SIZE - 19)  # 0 .. BOARD_SIZE - 20
+        y = self._next_index(BOARD_SIZE)
+        direction = DIRECTIONS[self._next_index(len(DIRECTIONS))]
+        length = 5 + self._next_index(11)  # 5 .. 15
+        color = self._next_color()
+        logger.info("🎨 Drawing %s line at (%d, %d)", direction, x, y)
+        await self.strategy_draw_line(x, y, length, direction, color)
     
     # ==========================================
     # Main Loop
@@ -170,77 +438,163 @@ class PixelWarAgent:
     
     async def run(self, interval: float = 2.0):
         """Main agent loop."""
-        print(f"🤖 {self.name} is starting...")
-        print(f"📡 Connecting to {BACKEND_URL}")
+        logger.info("🤖 %s is starting...", self.name)
+        if not AGENT_TOKEN:
+            logger.error("❌ AGENT_TOKEN is not set - the backend only accepts AI paints "
+                         "with a token matching its game.agent.token")
+            return
+        logger.info("📡 Connecting to %s", BACKEND_URL)
         
         # Test connection
         board = await self.get_board_state()
         if board:
-            print(f"✅ Connected! Board size: {board['width']}x{board['height']}")
+            logger.info("✅ Connected! Board size: %sx%s", board["width"], board["height"])
         else:
-            print("❌ Could not connect to server. Is it running?")
+            logger.error("❌ Could not connect to server. Is it running?")
             return
         
+        self._listener_task = asyncio.create_task(self._event_listener())
+        
         iteration = 0
+        self._sleep = interval
         
         while True:
             try:
                 iteration += 1
-                print(f"\n--- Iteration {iteration} ---")
+                logger.info("--- Iteration %d ---", iteration)
+                self._last_status = None
                 
-                # Mix of strategies
-                action = random.choice([
-                    "chaos",
-                    "chaos",
-                    "defend",
-                    "pattern",
-                    "line"
-                ])
-                
-                if action == "chaos":
-                    await self.strategy_random_chaos()
-                    
-                elif action == "defend":
+                # Reclaim territory first whenever our pixels were attacked,
+                # otherwise fall back to a weighted mix of strategies
+                if not self.event_queue.empty():
                     await self.strategy_defend_territory()
-                    
-                elif action == "pattern":
-                    pattern = random.choice(["square", "cross", "heart"])
-                    x = random.randint(5, BOARD_SIZE - 15)
-                    y = random.randint(5, BOARD_SIZE - 15)
-                    color = random.choice(self.colors)
-                    print(f"🎨 Drawing {pattern} at ({x}, {y})")
-                    await self.strategy_draw_pattern(pattern, x, y, color)
-                    
-                elif action == "line":
-                    x = random.randint(0, BOARD_SIZE - 20)
-                    y = random.randint(0, BOARD_SIZE - 1)
-                    direction = random.choice(["horizontal", "vertical"])
-                    length = random.randint(5, 15)
-                    color = random.choice(self.colors)
-                    print(f"🎨 Drawing {direction} line at ({x}, {y})")
-                    await self.strategy_draw_line(x, y, length, direction, color)
+                else:
+                    await self._strategies[self._next_index(len(self._strategies))]()
+                
+                if self._last_status == 403:
+                    # Retrying can't help until the backend and agent share a token
+                    logger.error("❌ Backend rejected our AGENT_TOKEN (HTTP 403) - "
+                                 "check it matches the backend's game.agent.token")
+                    break
                 
-                await asyncio.sleep(interval)
+                if self._adjust_sleep():
+                    # The server pushed back - sit out the whole backoff
+                    await asyncio.sleep(self._sleep)
+                else:
+                    # Sleep until the next tick, or until one of our pixels is attacked
+                    await self._wait_for_event(self._sleep)
+                self._event_arrived.clear()
                 
             except KeyboardInterrupt:
-                print("\n👋 Agent shutting down...")
+                logger.info("👋 Agent shutting down...")
                 break
             except Exception as e:
-                print(f"❌ Error: {e}")
+                logger.error("❌ Error: %s", e)
                 await asyncio.sleep(5)
     
+    def _record_status(self, status: int):
+        """Keep the most serious status seen this iteration, so a later 200 can't hide pushback."""
+        if _status_rank(status) >= _status_rank(self._last_status):
+            self._last_status = status
+    
+    def _adjust_sleep(self):
+        """Speed up while paints succeed, back off when the server pushes back.
+        
+        Returns True when this iteration backed off.
+        """
+        status = self._last_status
+        if status is None:
+            return False  # Nothing was sent this iteration
+        if status == 200:
+            self._sleep = max(MIN_INTERVAL, self._sleep * 0.9)
+        elif status == 0 or status == 429 or status >= 500:
+            self._sleep = min(MAX_INTERVAL, self._sleep * 2)
+            return True
+        return False
+    
+    async def _wait_for_event(self, timeout: float):
+        """Wait up to `timeout` seconds for the listener to report an attack."""
+        # asyncio.wait (unlike wait_for) never swallows a cancellation of run()
+        waiter = asyncio.ensure_future(self._event_arrived.wait())
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            waiter.cancel()
+    
     async def close(self):
         """Cleanup."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
         await self.client.aclose()
+        self.my_pixels.flush()
+        self.my_pixels.close()
+
+
+def setup_logging():
+    """Log through a queue so the event loop never blocks writing to stderr."""
+    level_name = LOG_LEVEL.upper()
+    if level_name == "OFF":
+        logger.disabled = True
+        return None
+    
+    level = logging.getLevelName(level_name)
+    unknown_level = not isinstance(level, int)  # getLevelName hands back a string for unknown names
+    if unknown_level:
+        level = logging.INFO
+    logger.setLevel(level)
+    logger.propagate = False
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    if unknown_level:
+        logger.warning("Unknown AGENT_LOG_LEVEL %r, using INFO", LOG_LEVEL)
+    return listener
+
+
+def run_event_loop(coro):
+    """Run `coro` on uvloop when available - it's a faster drop-in asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop:
+        factory = uvloop.new_event_loop
+    elif sys.platform == "win32":
+        # httpx is happier on the selector loop than the default proactor
+        factory = asyncio.SelectorEventLoop
+    else:
+        factory = None
+    
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=factory)
+    
+    # Older Pythons have no loop_factory; install the loop through a policy instead
+    if uvloop:
+        uvloop.install()
+    elif factory:
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    return asyncio.run(coro)
 
 
 async def main():
     """Entry point."""
+    listener = setup_logging()
     agent = PixelWarAgent(name="ChaosBot")
     try:
         await agent.run(interval=1.5)  # Act every 1.5 seconds
     finally:
         await agent.close()
+        if listener:
+            listener.stop()
 
 
 if __name__ == "__main__":
@@ -250,4 +604,4 @@ if __name__ == "__main__":
     ║         🤖 Autonomous Mode 🤖          ║
     ╚═══════════════════════════════════════╝
     """)
-    asyncio.run(main())
+    run_event_loop(main())
@@ -1,12 +1,15 @@
 package com.hackclub.pixelwar.config;
 
+import org.springframework.boot.web.servlet.FilterRegistrationBean;
+import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
+import org.springframework.web.filter.ShallowEtagHeaderFilter;
 import org.springframework.web.servlet.config.annotation.CorsRegistry;
 import org.springframework.web.servlet.config.annotation.ResourceHandlerRegistry;
 import org.springframework.web.servlet.config.annotation.WebMvcConfigurer;
 
 /**
- * Web configuration for CORS and static resources.
+ * Web configuration for CORS, static resources and HTTP caching.
  */
 @Configuration
 public class WebConfig implements WebMvcConfigurer {
@@ -27,4 +30,13 @@ public class WebConfig implements WebMvcConfigurer {
         registry.addResourceHandler("/**")
                 .addResourceLocations("classpath:/static/");
     }
+    
+    @Bean
+    public FilterRegistrationBean<ShallowEtagHeaderFilter> boardEtagFilter() {
+        // ETag the board so polling clients get a 304 when nothing changed
+        FilterRegistrationBean<ShallowEtagHeaderFilter> registration =
+                new FilterRegistrationBean<>(new ShallowEtagHeaderFilter());
+        registration.addUrlPatterns("/api/board");
+        return registration;
+    }
 }
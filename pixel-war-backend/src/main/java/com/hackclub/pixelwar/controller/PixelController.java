@@ -1,14 +1,22 @@
 package com.hackclub.pixelwar.controller;
 
 import com.hackclub.pixelwar.model.BoardState;
+import com.hackclub.pixelwar.model.PixelBatch;
 import com.hackclub.pixelwar.model.PixelEvent;
 import com.hackclub.pixelwar.service.RedisStreamService;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
 
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.regex.Pattern;
 
 /**
  * REST Controller for the Pixel War game.
@@ -18,8 +26,15 @@ import java.util.Map;
 @RequestMapping("/api")
 public class PixelController {
     
+    private static final int MAX_BATCH_SIZE = 100;
+    private static final Pattern AI_SOURCE = Pattern.compile("^AI_AGENT(:[A-Za-z0-9_-]{1,32})?$");
+    
     private final RedisStreamService pixelService;
     
+    // Shared secret AI agents send in X-Agent-Token; empty disables AI sources
+    @Value("${game.agent.token:}")
+    private String agentToken;
+    
     public PixelController(RedisStreamService pixelService) {
         this.pixelService = pixelService;
     }
@@ -41,6 +56,61 @@ public class PixelController {
         return ResponseEntity.ok(response);
     }
     
+    /**
+     * Paint several pixels in one request - for AI agents drawing shapes.
+     * POST /api/paint/batch
+     */
+    @PostMapping("/paint/batch")
+    public ResponseEntity<Map<String, Object>> paintBatch(
+            @RequestBody PixelBatch batch,
+            @RequestHeader(value = "X-Agent-Token", required = false) String token) {
+        List<PixelEvent> pixels = batch.getPixels();
+        if (pixels == null || pixels.isEmpty() || pixels.size() > MAX_BATCH_SIZE) {
+            Map<String, Object> error = new HashMap<>();
+            error.put("status", "error");
+            error.put("message", String.format("Batch must contain 1-%d pixels", MAX_BATCH_SIZE));
+            return ResponseEntity.badRequest().body(error);
+        }
+        if (pixels.contains(null)) {
+            Map<String, Object> error = new HashMap<>();
+            error.put("status", "error");
+            error.put("message", "Batch must not contain null pixels");
+            return ResponseEntity.badRequest().body(error);
+        }
+        
+        String source = batch.getSource() != null ? batch.getSource() : "HUMAN";
+        if (!"HUMAN".equals(source)
+                && !(AI_SOURCE.matcher(source).matches() && isTrustedAgent(token))) {
+            Map<String, Object> error = new HashMap<>();
+            error.put("status", "error");
+            error.put("message", "Source " + source + " requires a valid agent token");
+            return ResponseEntity.status(HttpStatus.FORBIDDEN).body(error);
+        }
+        
+        for (PixelEvent event : pixels) {
+            event.setSource(source);
+        }
+        int painted = pixelService.paintPixels(pixels);
+        
+        Map<String, Object> response = new HashMap<>();
+        response.put("status", "ok");
+        response.put("painted", painted);
+        
+        return ResponseEntity.ok(response);
+    }
+    
+    /**
+     * Check the caller's agent token against the configured one.
+     */
+    private boolean isTrustedAgent(String token) {
+        if (agentToken == null || agentToken.isEmpty() || token == null) {
+            return false;
+        }
+        return MessageDigest.isEqual(
+                agentToken.getBytes(StandardCharsets.UTF_8),
+                token.getBytes(StandardCharsets.UTF_8));
+    }
+    
     /**
      * Get the full board state - for new clients joining.
      * GET /api/board
@@ -67,6 +137,15 @@ public class PixelController {
         return ResponseEntity.ok(pixelService.getRecentEvents());
     }
     
+    /**
+     * Stream new events as they happen - lets AI agents react without polling.
+     * GET /api/events/stream
+     */
+    @GetMapping(value = "/events/stream", produces = MediaType.TEXT_EVENT_STREAM_VALUE)
+    public SseEmitter streamEvents() {
+        return pixelService.subscribe();
+    }
+    
     /**
      * Health check endpoint.
      * GET /api/health
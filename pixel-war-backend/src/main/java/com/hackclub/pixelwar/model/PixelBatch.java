@@ -0,0 +1,34 @@
+package com.hackclub.pixelwar.model;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * A group of pixels painted together in one request (lines, patterns, etc).
+ */
+public class PixelBatch {
+
+    private List<PixelEvent> pixels = new ArrayList<>();
+    private String source; // Applied to every pixel in the batch
+
+    public PixelBatch() {
+    }
+
+    // Getters and Setters
+
+    public List<PixelEvent> getPixels() {
+        return pixels;
+    }
+
+    public void setPixels(List<PixelEvent> pixels) {
+        this.pixels = pixels;
+    }
+
+    public String getSource() {
+        return source;
+    }
+
+    public void setSource(String source) {
+        this.source = source;
+    }
+}
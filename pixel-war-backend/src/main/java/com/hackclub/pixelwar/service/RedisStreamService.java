@@ -10,9 +10,13 @@ import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.data.domain.Range;
 import org.springframework.data.redis.connection.stream.*;
+import org.springframework.data.redis.core.RedisOperations;
+import org.springframework.data.redis.core.SessionCallback;
+import org.springframework.data.redis.core.StreamOperations;
 import org.springframework.data.redis.core.StringRedisTemplate;
 import org.springframework.messaging.simp.SimpMessagingTemplate;
 import org.springframework.stereotype.Service;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
 
 import java.time.Duration;
 import java.util.ArrayList;
@@ -20,9 +24,13 @@ import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.concurrent.ConcurrentLinkedDeque;
+import java.util.concurrent.CopyOnWriteArrayList;
 import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.TimeUnit;
 import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.function.Supplier;
 
 /**
  * Core service that bridges Redis Streams with WebSocket updates.
@@ -35,6 +43,7 @@ public class RedisStreamService {
     
     private static final Logger log = LoggerFactory.getLogger(RedisStreamService.class);
     private static final int MAX_RECENT_EVENTS = 100;
+    private static final long SSE_HEARTBEAT_SECONDS = 15;
     
     private final StringRedisTemplate redisTemplate;
     private final SimpMessagingTemplate webSocket;
@@ -52,6 +61,12 @@ public class RedisStreamService {
     // Buffer of recent events for new clients
     private final ConcurrentLinkedDeque<PixelEvent> recentEvents;
     
+    // Server-Sent Events subscribers (AI agents that don't speak STOMP)
+    private final List<SseEmitter> sseEmitters = new CopyOnWriteArrayList<>();
+    
+    // SSE writes run here so a slow subscriber never stalls the consumer thread
+    private final ScheduledExecutorService sseExecutor = Executors.newSingleThreadScheduledExecutor();
+    
     // Background consumer thread
     private final ExecutorService executor = Executors.newSingleThreadExecutor();
     private final AtomicBoolean running = new AtomicBoolean(false);
@@ -84,6 +99,11 @@ public class RedisStreamService {
         // Start background consumer
         startConsumer();
         
+        // Keep SSE connections alive and notice subscribers that went away
+        sseExecutor.scheduleAtFixedRate(
+                () -> sendToSubscribers(() -> SseEmitter.event().comment("heartbeat")),
+                SSE_HEARTBEAT_SECONDS, SSE_HEARTBEAT_SECONDS, TimeUnit.SECONDS);
+        
         log.info("🚀 Redis Stream Service initialized");
         log.info("📋 Stream: {}, Consumer Group: {}, Consumer: {}", streamName, consumerGroup, consumerId);
     }
@@ -92,6 +112,8 @@ public class RedisStreamService {
     public void shutdown() {
         running.set(false);
         executor.shutdown();
+        sseExecutor.shutdownNow();
+        sseEmitters.forEach(SseEmitter::complete);
         log.info("👋 Redis Stream Service shut down");
     }
     
@@ -198,6 +220,7 @@ public class RedisStreamService {
                 // Broadcast to all connected WebSocket clients
                 String json = gson.toJson(event);
                 webSocket.convertAndSend("/topic/board", json);
+                pushToSubscribers(json);
                 
                 // If there's a taunt message, broadcast it too
                 if (event.getMessage() != null && !event.getMessage().isEmpty()) {
@@ -219,16 +242,76 @@ public class RedisStreamService {
      * This is the ONLY way pixels should be painted.
      */
     public void paintPixel(PixelEvent event) {
+        Map<String, String> message = toStreamMessage(event);
+        if (message == null) {
+            return;
+        }
+        
+        try {
+            // Add to Redis Stream - the source of truth
+            RecordId recordId = redisTemplate.opsForStream().add(streamName, message);
+            log.debug("✅ Sent to Redis Stream: {} -> {}", recordId, message);
+        } catch (Exception e) {
+            log.error("❌ Failed to send to Redis Stream: {}", e.getMessage());
+        }
+    }
+    
+    /**
+     * Paint several pixels at once - one pipelined round-trip to Redis.
+     * Invalid pixels are skipped, the rest are still painted.
+     *
+     * @return the number of pixels sent to the stream
+     */
+    public int paintPixels(List<PixelEvent> events) {
+        List<Map<String, String>> messages = new ArrayList<>(events.size());
+        for (PixelEvent event : events) {
+            Map<String, String> message = toStreamMessage(event);
+            if (message != null) {
+                messages.add(message);
+            }
+        }
+        
+        if (messages.isEmpty()) {
+            return 0;
+        }
+        
+        try {
+            redisTemplate.executePipelined(new SessionCallback<Object>() {
+                @Override
+                @SuppressWarnings("unchecked")
+                public <K, V> Object execute(RedisOperations<K, V> operations) {
+                    StreamOperations<String, String, String> ops =
+                            (StreamOperations<String, String, String>) operations.opsForStream();
+                    for (Map<String, String> message : messages) {
+                        ops.add(streamName, message);
+                    }
+                    return null;
+                }
+            });
+            log.debug("✅ Sent batch of {} pixels to Redis Stream", messages.size());
+            return messages.size();
+        } catch (Exception e) {
+            log.error("❌ Failed to send batch to Redis Stream: {}", e.getMessage());
+            return 0;
+        }
+    }
+    
+    /**
+     * Validate an event and build the Redis Stream message for it.
+     *
+     * @return the message map, or null if the event is invalid
+     */
+    private Map<String, String> toStreamMessage(PixelEvent event) {
         // Validate coordinates
         if (!boardState.isValidCoordinate(event.getX(), event.getY())) {
             log.warn("Invalid coordinates: {}, {}", event.getX(), event.getY());
-            return;
+            return null;
         }
         
         // Validate color format
         if (event.getColor() == null || !event.getColor().matches("^#[0-9A-Fa-f]{6}$")) {
             log.warn("Invalid color format: {}", event.getColor());
-            return;
+            return null;
         }
         
         // Ensure timestamp
@@ -248,13 +331,7 @@ public class RedisStreamService {
             message.put("message", event.getMessage());
         }
         
-        try {
-            // Add to Redis Stream - the source of truth
-            RecordId recordId = redisTemplate.opsForStream().add(streamName, message);
-            log.debug("✅ Sent to Redis Stream: {} -> {}", recordId, message);
-        } catch (Exception e) {
-            log.error("❌ Failed to send to Redis Stream: {}", e.getMessage());
-        }
+        return message;
     }
     
     /**
@@ -271,6 +348,43 @@ public class RedisStreamService {
         return new ArrayList<>(recentEvents);
     }
     
+    /**
+     * Subscribe to new events as a Server-Sent Events stream.
+     */
+    public SseEmitter subscribe() {
+        SseEmitter emitter = new SseEmitter(0L); // Never time out
+        sseEmitters.add(emitter);
+        emitter.onCompletion(() -> sseEmitters.remove(emitter));
+        emitter.onTimeout(() -> sseEmitters.remove(emitter));
+        emitter.onError(e -> sseEmitters.remove(emitter));
+        return emitter;
+    }
+    
+    /**
+     * Queue an event for every SSE subscriber on the SSE executor.
+     */
+    private void pushToSubscribers(String json) {
+        if (sseEmitters.isEmpty() || sseExecutor.isShutdown()) {
+            return;
+        }
+        sseExecutor.execute(() -> sendToSubscribers(() -> SseEmitter.event().data(json)));
+    }
+    
+    /**
+     * Send to every SSE subscriber, completing the ones that went away.
+     * The builder is created per subscriber since a built event can't be reused.
+     */
+    private void sendToSubscribers(Supplier<SseEmitter.SseEventBuilder> event) {
+        for (SseEmitter emitter : sseEmitters) {
+            try {
+                emitter.send(event.get());
+            } catch (Exception e) {
+                sseEmitters.remove(emitter);
+                emitter.completeWithError(e);
+            }
+        }
+    }
+    
     /**
      * Simple chat message record.
      */